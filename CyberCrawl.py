@@ -1,40 +1,222 @@
 
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog, scrolledtext
-from bs4 import BeautifulSoup
+import lxml.html
+from lxml import etree
+from cssselect import HTMLTranslator, SelectorError
+from pybloom_live import ScalableBloomFilter
 import requests
-import pandas as pd
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import time
 import json
+import csv
 import threading
 import logging
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
 from datetime import datetime
 import sys
+import os
+import multiprocessing
 import queue
 import re
+from collections import deque
+import ahocorasick
+from concurrent.futures import ProcessPoolExecutor
+from urllib.parse import urljoin, urlsplit, urlunsplit
 
 TOR_SOCKS_PROXY = 'socks5h://127.0.0.1:9050'
+MAX_PAGE_BYTES = 5 * 1024 * 1024
+HTML_CONTENT_TYPES = ('text/html', 'application/xhtml+xml')
+DEFAULT_PORTS = {'http': 80, 'https': 443}
+
+def _canonicalize(url: str) -> str:
+    """Normalize a URL so trivial variants of the same page dedupe to one entry."""
+    parts = urlsplit(url)
+    scheme = parts.scheme.lower()
+    try:
+        port = parts.port
+    except ValueError:
+        return url
+    userinfo = parts.netloc.rpartition('@')[0]
+    netloc = (userinfo + '@' if userinfo else '') + (parts.hostname or '')
+    if port and port != DEFAULT_PORTS.get(scheme):
+        netloc += f":{port}"
+    # Sort the raw pieces so the fetched query keeps its original encoding
+    query = '&'.join(sorted(piece for piece in parts.query.split('&') if piece))
+    return urlunsplit((scheme, netloc, parts.path or '/', query, ''))
+
+_CONTENT_TAGS = ('p', 'div', 'span', 'h1', 'h2', 'li')
+# Content elements with at least 20 characters of text, capped at $n; length filter and limit run in libxml2
+_CONTENT_ELEMENTS = etree.XPath(
+    "(" + "|".join(f"//{tag}" for tag in _CONTENT_TAGS) + ")"
+    "[string-length(normalize-space(.)) >= 20][position() <= $n]"
+)
+# First link inside an element, else the <a> wrapping it
+_DESCENDANT_HREF = etree.XPath('descendant::a[@href][1]/@href')
+_ANCESTOR_HREF = etree.XPath('ancestor::a[@href][1]/@href')
+
+_META_CHARSET = re.compile(rb'<meta[^>]+charset', re.IGNORECASE)
+_BOMS = (b'\xef\xbb\xbf', b'\xff\xfe', b'\xfe\xff')
+
+def _charset_from_content_type(content_type: str) -> Optional[str]:
+    """Return the charset parameter of a Content-Type header, if any."""
+    for param in content_type.split(';')[1:]:
+        key, _, value = param.partition('=')
+        if key.strip().lower() == 'charset':
+            return value.strip().strip('"\'') or None
+    return None
+
+def _parse_html(body: bytes, charset: Optional[str] = None) -> Optional[lxml.html.HtmlElement]:
+    """Parse an HTML body with lxml, returning None for an empty document.
+
+    `charset` comes from the HTTP header; without one a <meta> charset or BOM
+    decides, and anything else is read as UTF-8 rather than libxml2's Latin-1.
+    """
+    if not charset and not body.startswith(_BOMS) and not _META_CHARSET.search(body, 0, 4096):
+        charset = 'utf-8'
+    try:
+        parser = lxml.html.HTMLParser(encoding=charset) if charset else None
+    except LookupError:
+        parser = lxml.html.HTMLParser(encoding='utf-8')
+    try:
+        tree = lxml.html.document_fromstring(body, parser=parser)
+    except etree.ParserError:
+        return None
+    # Drop non-visible code so it never ends up in scraped text (as BeautifulSoup's get_text did)
+    etree.strip_elements(tree, 'script', 'style', 'template', with_tail=False)
+    return tree
+
+def _extract_onion_links(tree: lxml.html.HtmlElement, base_url: str) -> List[str]:
+    # dict keeps document order, so the crawl frontier is deterministic
+    links = {}
+    for href in tree.xpath('//a/@href'):
+        if not href:
+            continue
+        try:
+            # Absolute or relative, resolved against the page URL
+            link = urljoin(base_url, href)
+            if link.startswith(("http://", "https://")) and ".onion" in urlsplit(link).netloc:
+                links[_canonicalize(link)] = None
+        except ValueError:
+            # Malformed href (e.g. a broken IPv6 host); skip just this link
+            continue
+    return list(links)
+
+def _scrape_tree(tree: lxml.html.HtmlElement, url: str, keywords: List[str], selector_xpaths: List[str],
+                 max_items: int) -> List[Dict]:
+    """Extract text/link rows from a parsed page, optionally filtered by keywords or selectors.
+
+    `selector_xpaths` are CSS selectors already translated to XPath.
+    """
+    # One automaton pass per element finds any keyword regardless of how many there are
+    keyword_automaton = None
+    # Empty keywords can't be added to the automaton, so they are ignored
+    keywords_lower = [kw.lower() for kw in keywords or [] if kw]
+    if keywords_lower:
+        keyword_automaton = ahocorasick.Automaton()
+        for kw_lower in keywords_lower:
+            keyword_automaton.add_word(kw_lower, kw_lower)
+        keyword_automaton.make_automaton()
+    data = []
+    elements = []
+    if selector_xpaths:
+        # Use the first selector with matches
+        for xp in selector_xpaths:
+            found = tree.xpath(xp)
+            if found:
+                elements = found[:max_items]
+                break
+    if not elements:
+        elements = _CONTENT_ELEMENTS(tree, n=max_items)
+    for elem in elements:
+        try:
+            text = "".join(s.strip() for s in elem.itertext())
+            if not text or len(text) < 20:
+                continue
+            if keyword_automaton is not None and next(keyword_automaton.iter(text.lower()), None) is None:
+                continue
+            hrefs = _DESCENDANT_HREF(elem) or _ANCESTOR_HREF(elem)
+            link = hrefs[0] if hrefs else ""
+            data.append({
+                'text': text[:500],
+                'link': link,
+                'tag': elem.tag,
+                'source': url,
+            })
+        except Exception as e:
+            logging.getLogger(__name__).error(f"Error parsing element: {e}")
+    return data
+
+def _parse_worker(url: str, body: bytes, charset: Optional[str], keywords: List[str], selector_xpaths: List[str],
+                  max_items: int, follow_links: bool):
+    """Parse one fetched page in a worker process, returning (links, data_rows)."""
+    tree = _parse_html(body, charset)
+    if tree is None:
+        return [], []
+    links = _extract_onion_links(tree, url) if follow_links else []
+    return links, _scrape_tree(tree, url, keywords, selector_xpaths, max_items)
 
 class DarkWebScraper:
     """Core dark web scraping functionality using Tor."""
 
-    def __init__(self, delay: float = 2.0, max_items: int = 20, max_depth: int = 1):
+    def __init__(self, delay: float = 2.0, max_items: int = 20, max_depth: int = 1, max_workers: int = 8):
         self.delay = delay
         self.max_items = max_items
         self.max_depth = max_depth
+        self.max_workers = max_workers
+        self._rate_lock = threading.Lock()
+        self._next_request_at = 0.0
+        # Bloom filter of crawled URLs, created fresh by each crawl_onion call;
+        # a rare false positive only skips a page
+        self._visited = None
+        # CSS selector -> XPath, translated once per scraper instead of once per page
+        self._xpath_cache = {}
         self.session = requests.Session()
         self.session.proxies = {
             'http': TOR_SOCKS_PROXY,
             'https': TOR_SOCKS_PROXY
         }
+        # Keep-alive pool sized well above max_workers so circuits to a host get reused;
+        # flaky circuits are retried inside urllib3 instead of dropping the page
+        adapter = HTTPAdapter(
+            pool_connections=64,
+            pool_maxsize=64,
+            max_retries=Retry(
+                total=3,
+                connect=3,
+                read=2,
+                backoff_factor=1.0,
+                status_forcelist=(502, 503, 504, 520, 522),
+                allowed_methods=frozenset(['GET'])
+            )
+        )
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
         self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
+            'Connection': 'keep-alive',
+            # Only advertises br when a brotli decoder is installed
+            'Accept-Encoding': requests.utils.DEFAULT_ACCEPT_ENCODING
         })
         logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
         self.logger = logging.getLogger(__name__)
 
-    def get_page(self, url: str) -> Optional[BeautifulSoup]:
+    def _wait_for_slot(self, stop_event: Optional[threading.Event] = None):
+        """Space request starts `delay` seconds apart across all worker threads."""
+        with self._rate_lock:
+            now = time.monotonic()
+            start_at = max(now, self._next_request_at)
+            self._next_request_at = start_at + self.delay
+        if start_at > now:
+            if stop_event is not None:
+                # Wakes early when the crawl is stopped
+                stop_event.wait(start_at - now)
+            else:
+                time.sleep(start_at - now)
+
+    def _fetch(self, url: str, stop_event: Optional[threading.Event] = None) -> Optional[Tuple[bytes, Optional[str]]]:
+        """Download a .onion page, returning its (size-capped) HTML body and header charset, or None."""
         # Only allow .onion
         if not url.startswith("http://") and not url.startswith("https://"):
             self.logger.error(f"Invalid scheme for URL: {url}")
@@ -43,92 +225,149 @@ class DarkWebScraper:
             self.logger.warning(f"Non-onion address skipped: {url}")
             return None
         try:
-            resp = self.session.get(url, timeout=25)
-            resp.raise_for_status()
-            soup = BeautifulSoup(resp.content, 'html.parser')
-            time.sleep(self.delay)
-            return soup
+            self._wait_for_slot(stop_event)
+            if stop_event is not None and stop_event.is_set():
+                # Stopped while waiting for a request slot
+                return None
+            with self.session.get(url, timeout=25, stream=True) as resp:
+                resp.raise_for_status()
+                content_type = resp.headers.get('Content-Type', '').lower()
+                if content_type and not content_type.startswith(HTML_CONTENT_TYPES):
+                    self.logger.warning(f"Non-HTML content ({content_type}) skipped: {url}")
+                    return None
+                charset = _charset_from_content_type(content_type)
+                # Cap the body so huge or binary pages can't exhaust memory
+                buf = bytearray()
+                for chunk in resp.iter_content(65536):
+                    buf.extend(chunk)
+                    if len(buf) > MAX_PAGE_BYTES:
+                        self.logger.warning(f"Page truncated at {MAX_PAGE_BYTES} bytes: {url}")
+                        break
+            return bytes(buf), charset
         except Exception as e:
             self.logger.error(f"Failed to fetch {url}: {e}")
             return None
 
-    def extract_onion_links(self, soup: BeautifulSoup, base_url: str) -> List[str]:
-        links = set()
-        for a in soup.find_all('a', href=True):
-            href = a['href']
-            if ".onion" in href:
-                # Absolute or relative
-                if href.startswith("http"):
-                    links.add(href)
-                elif href.startswith("/"):
-                    onion_host = re.match(r"(http[s]?://[^/]+)", base_url)
-                    if onion_host:
-                        links.add(onion_host.group(1) + href)
-        return list(links)
+    def _fetch_wave(self, urls: List[str], stop_event: threading.Event):
+        """Fetch `urls` on up to max_workers daemon threads, yielding (index, fetched) as each finishes.
+
+        Daemon threads never hold up interpreter exit on a slow Tor request, and
+        results are polled so a stop is noticed without waiting for a fetch.
+        """
+        pending = queue.Queue()
+        for index, url in enumerate(urls):
+            pending.put((index, url))
+        done = queue.Queue()
+
+        def worker():
+            while not stop_event.is_set():
+                try:
+                    index, url = pending.get_nowait()
+                except queue.Empty:
+                    return
+                done.put((index, self._fetch(url, stop_event)))
+
+        for _ in range(min(self.max_workers, len(urls))):
+            threading.Thread(target=worker, daemon=True).start()
+        received = 0
+        while received < len(urls) and not stop_event.is_set():
+            try:
+                item = done.get(timeout=0.5)
+            except queue.Empty:
+                continue
+            received += 1
+            yield item
+
+    def get_page(self, url: str) -> Optional[lxml.html.HtmlElement]:
+        fetched = self._fetch(url)
+        if fetched is None:
+            return None
+        return _parse_html(*fetched)
+
+    def _selector_xpaths(self, selectors: List[str]) -> List[str]:
+        """Translate CSS selectors to XPath, reusing earlier translations."""
+        xpaths = []
+        for sel in selectors or []:
+            if sel not in self._xpath_cache:
+                try:
+                    self._xpath_cache[sel] = HTMLTranslator().css_to_xpath(sel)
+                except SelectorError as e:
+                    self.logger.error(f"Invalid CSS selector {sel!r}: {e}")
+                    self._xpath_cache[sel] = None
+            if self._xpath_cache[sel]:
+                xpaths.append(self._xpath_cache[sel])
+        return xpaths
+
+    def extract_onion_links(self, tree: lxml.html.HtmlElement, base_url: str) -> List[str]:
+        return _extract_onion_links(tree, base_url)
 
     def scrape_content(self, url: str, keywords: List[str] = None, selectors: List[str] = None) -> List[Dict]:
         """Scrape a single .onion page for text, links, and optionally filter by keywords or selectors."""
-        soup = self.get_page(url)
-        if not soup:
+        return self._scrape_page_tree(self.get_page(url), url, keywords=keywords, selectors=selectors)
+
+    def _scrape_page_tree(self, tree: Optional[lxml.html.HtmlElement], url: str, keywords: List[str] = None,
+                          selectors: List[str] = None) -> List[Dict]:
+        """Scrape an already-fetched page tree, so callers holding one never fetch it again."""
+        if tree is None:
             return []
-        data = []
-        elements = []
-        if selectors:
-            # Use the first selector with matches
-            for sel in selectors:
-                found = soup.select(sel)
-                if found:
-                    elements = found[:self.max_items]
-                    break
-        if not elements:
-            elements = soup.find_all(['p', 'div', 'span', 'h1', 'h2', 'li'], limit=self.max_items)
-        for elem in elements:
-            try:
-                text = elem.get_text(strip=True)
-                if not text or len(text) < 20:
-                    continue
-                if keywords and not any(kw.lower() in text.lower() for kw in keywords):
-                    continue
-                link = ""
-                a_tag = elem.find('a') or elem.find_parent('a')
-                if a_tag and a_tag.get('href'):
-                    link = a_tag['href']
-                data.append({
-                    'text': text[:500],
-                    'link': link,
-                    'tag': elem.name,
-                    'source': url,
-                })
-            except Exception as e:
-                self.logger.error(f"Error parsing element: {e}")
-        return data
+        return _scrape_tree(tree, url, keywords, self._selector_xpaths(selectors), self.max_items)
 
     def crawl_onion(self, start_urls: List[str], keywords: List[str] = None, selectors: List[str] = None,
-                    max_pages: int = 30) -> List[Dict]:
-        """Crawl .onion domains starting from a seed list, following .onion links, breadth-first."""
-        visited = set()
+                    max_pages: int = 30, stop_event: Optional[threading.Event] = None) -> List[Dict]:
+        """Crawl .onion domains starting from a seed list, following .onion links, breadth-first.
+
+        Setting `stop_event` (owned by the caller, one per crawl) ends the crawl early.
+
+        Each depth level is fetched as one wave on daemon worker threads; the
+        rate limiter keeps the overall request rate bounded by `delay`. Bodies
+        are handed to a process pool for parsing as soon as they arrive, so
+        parsing overlaps with the fetches still in flight.
+        """
+        if stop_event is None:
+            stop_event = threading.Event()
+        self._visited = ScalableBloomFilter(initial_capacity=10000, error_rate=1e-6)
+        selector_xpaths = self._selector_xpaths(selectors)
         results = []
-        q = queue.Queue()
-        for url in start_urls:
-            q.put((url, 0))
+        frontier = deque((_canonicalize(url), 0) for url in start_urls)
         pages_crawled = 0
-        while not q.empty() and pages_crawled < max_pages:
-            url, depth = q.get()
-            if url in visited or depth > self.max_depth:
-                continue
-            visited.add(url)
-            self.logger.info(f"Crawling {url} (depth {depth})")
-            soup = self.get_page(url)
-            if soup:
-                # Scrape current
-                page_data = self.scrape_content(url, keywords=keywords, selectors=selectors)
-                results.extend(page_data)
-                # Find new .onion links
-                if depth < self.max_depth:
-                    for link in self.extract_onion_links(soup, url):
-                        if link not in visited:
-                            q.put((link, depth + 1))
-            pages_crawled += 1
+        with ProcessPoolExecutor(max_workers=os.cpu_count(),
+                                 mp_context=multiprocessing.get_context('spawn')) as parsers:
+            while frontier and pages_crawled < max_pages and not stop_event.is_set():
+                # Everything queued now sits at the same depth: drain it into one wave
+                wave = []
+                while frontier and pages_crawled + len(wave) < max_pages:
+                    url, depth = frontier.popleft()
+                    if url in self._visited or depth > self.max_depth:
+                        continue
+                    self._visited.add(url)
+                    wave.append((url, depth))
+                for url, depth in wave:
+                    self.logger.info(f"Crawling {url} (depth {depth})")
+                # Wave position -> parse future, so results keep BFS order however fetches finish
+                parses = {}
+                for index, fetched in self._fetch_wave([url for url, _ in wave], stop_event):
+                    url, depth = wave[index]
+                    if fetched is None:
+                        continue
+                    body, charset = fetched
+                    parses[index] = parsers.submit(_parse_worker, url, body, charset, keywords, selector_xpaths,
+                                                   self.max_items, depth < self.max_depth)
+                for index in sorted(parses):
+                    url, depth = wave[index]
+                    try:
+                        links, page_data = parses[index].result()
+                    except Exception as e:
+                        self.logger.error(f"Error parsing {url}: {e}")
+                        continue
+                    results.extend(page_data)
+                    # Find new .onion links
+                    for link in links:
+                        if link not in self._visited:
+                            frontier.append((link, depth + 1))
+                pages_crawled += len(wave)
+        if stop_event.is_set():
+            # Drop pooled keep-alive circuits; fetches still in flight are abandoned
+            self.session.close()
         return results[:self.max_items]
 
     def search_onion_directories(self, custom_words: str, num_results: int = 5) -> List[str]:
@@ -142,8 +381,9 @@ class DarkWebScraper:
         try:
             url = f"https://ahmia.fi/search/?q={requests.utils.quote(custom_words)}"
             resp = requests.get(url, timeout=15)
-            soup = BeautifulSoup(resp.content, 'html.parser')
-            for a in soup.select('.result .title a'):
+            tree = _parse_html(resp.content, _charset_from_content_type(resp.headers.get('Content-Type', '')))
+            anchors = tree.cssselect('.result .title a') if tree is not None else []
+            for a in anchors:
                 href = a.get('href')
                 if href and ".onion" in href:
                     results.append(href)
@@ -169,9 +409,14 @@ class DarkWebScraperGUI:
         self.scraper = None
         self.scraped_data = []
         self.is_scraping = False
+        # Set by Stop or on close; replaced with a fresh event for every crawl
+        self.stop_event = threading.Event()
+        # Log lines are queued from any thread and flushed to log_text in batches
+        self.log_queue = queue.Queue()
         self.setup_logging()
         self.create_widgets()
         self.root.protocol("WM_DELETE_WINDOW", self.on_closing)
+        self.root.after(100, self._drain_log_queue)
 
     def configure_styles(self):
         self.style.configure('Heading.TLabel', font=('Arial', 11, 'bold'), background='#202124', foreground='#ffe082')
@@ -325,11 +570,24 @@ class DarkWebScraperGUI:
     def log_message(self, message, level="INFO"):
         timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         log_entry = f"[{timestamp}] {level}: {message}\n"
-        self.log_text.insert(tk.END, log_entry)
-        self.log_text.see(tk.END)
-        self.root.update_idletasks()
+        self.log_queue.put(log_entry)
         self.logger.info(message)
 
+    def _flush_log_queue(self, limit=None):
+        entries = []
+        while limit is None or len(entries) < limit:
+            try:
+                entries.append(self.log_queue.get_nowait())
+            except queue.Empty:
+                break
+        if entries:
+            self.log_text.insert(tk.END, ''.join(entries))
+            self.log_text.see(tk.END)
+
+    def _drain_log_queue(self):
+        self._flush_log_queue(limit=200)
+        self.root.after(100, self._drain_log_queue)
+
     def sort_treeview(self, col):
         data = [(self.results_tree.set(child, col), child) for child in self.results_tree.get_children('')]
         data.sort()
@@ -350,17 +608,19 @@ class DarkWebScraperGUI:
         self.progress_bar.start()
         self.progress_var.set("🔄 Searching directories and crawling...")
         self.log_message(f"Searching for onion sites with: {custom_words}")
-        threading.Thread(target=self.scrape_data, daemon=True).start()
+        self.stop_event = threading.Event()
+        threading.Thread(target=self.scrape_data, args=(self.stop_event,), daemon=True).start()
 
     def stop_scraping(self):
         self.is_scraping = False
+        self.stop_event.set()
         self.start_button.config(state=tk.NORMAL)
         self.stop_button.config(state=tk.DISABLED)
         self.progress_bar.stop()
         self.progress_var.set("⏹️ Crawling stopped by user")
         self.log_message("Crawling stopped by user", "WARNING")
 
-    def scrape_data(self):
+    def scrape_data(self, stop_event: threading.Event):
         try:
             custom_words = self.custom_words_var.get().strip()
             keywords = [w.strip() for w in self.keywords_var.get().split(',') if w.strip()]
@@ -370,18 +630,21 @@ class DarkWebScraperGUI:
                 max_items=self.max_items_var.get(),
                 max_depth=self.depth_var.get()
             )
-            self.root.after(0, lambda: self.log_message("Initialized dark web scraper"))
+            if not self.is_scraping or stop_event.is_set():
+                # Stop was pressed before the scraper existed
+                return
+            self.log_message("Initialized dark web scraper")
             onion_urls = self.scraper.search_onion_directories(custom_words, num_results=10)
             if not onion_urls:
-                self.root.after(0, lambda: self.log_message("No .onion URLs found for given words.", "WARNING"))
+                self.log_message("No .onion URLs found for given words.", "WARNING")
                 self.root.after(0, self.scraping_finished)
                 return
-            self.root.after(0, lambda: self.log_message(f"Found {len(onion_urls)} seed .onion URLs. Starting crawl..."))
-            data = self.scraper.crawl_onion(onion_urls, keywords=keywords if keywords else None, selectors=selectors if selectors else None, max_pages=100)
+            self.log_message(f"Found {len(onion_urls)} seed .onion URLs. Starting crawl...")
+            data = self.scraper.crawl_onion(onion_urls, keywords=keywords if keywords else None, selectors=selectors if selectors else None, max_pages=100, stop_event=stop_event)
             self.root.after(0, lambda: self.update_results(data))
         except Exception as e:
             error_msg = f"Crawling error: {str(e)}"
-            self.root.after(0, lambda: self.log_message(error_msg, "ERROR"))
+            self.log_message(error_msg, "ERROR")
             self.root.after(0, lambda: messagebox.showerror("Crawling Error", error_msg))
         finally:
             self.root.after(0, self.scraping_finished)
@@ -397,19 +660,17 @@ class DarkWebScraperGUI:
         if not data:
             self.log_message("No data found during crawl", "WARNING")
             return
-        for item in self.results_tree.get_children():
-            self.results_tree.delete(item)
+        self.results_tree.delete(*self.results_tree.get_children())
         self.scraped_data = data
-        for item in data:
+        rows = [
+            (item.get('text', '')[:100], item.get('link', '')[:80], item.get('tag', ''), item.get('source', '')[:60])
+            for item in data
+        ]
+        for values in rows:
             if not self.is_scraping:
                 break
             try:
-                self.results_tree.insert('', tk.END, values=(
-                    item.get('text', '')[:100],
-                    item.get('link', '')[:80],
-                    item.get('tag', ''),
-                    item.get('source', '')[:60]
-                ))
+                self.results_tree.insert('', tk.END, values=values)
             except Exception as e:
                 self.log_message(f"Error adding item to results: {e}", "ERROR")
         total_items = len(data)
@@ -417,8 +678,7 @@ class DarkWebScraperGUI:
         self.log_message(f"Successfully crawled {total_items} items")
 
     def clear_results(self):
-        for item in self.results_tree.get_children():
-            self.results_tree.delete(item)
+        self.results_tree.delete(*self.results_tree.get_children())
         self.scraped_data = []
         self.stats_var.set("Items found: 0 | Total scraped: 0")
         self.progress_var.set("Ready to crawl dark web...")
@@ -435,8 +695,10 @@ class DarkWebScraperGUI:
         )
         if filename:
             try:
-                df = pd.DataFrame(self.scraped_data)
-                df.to_csv(filename, index=False, encoding='utf-8')
+                with open(filename, 'w', newline='', encoding='utf-8') as f:
+                    writer = csv.DictWriter(f, fieldnames=['text', 'link', 'tag', 'source'])
+                    writer.writeheader()
+                    writer.writerows(self.scraped_data)
                 self.log_message(f"Data exported to CSV: {filename}")
                 messagebox.showinfo("Success", f"Data exported successfully to:\n{filename}")
             except Exception as e:
@@ -455,8 +717,10 @@ class DarkWebScraperGUI:
         )
         if filename:
             try:
+                encoder = json.JSONEncoder(indent=2, ensure_ascii=False)
                 with open(filename, 'w', encoding='utf-8') as f:
-                    json.dump(self.scraped_data, f, indent=2, ensure_ascii=False)
+                    for chunk in encoder.iterencode(self.scraped_data):
+                        f.write(chunk)
                 self.log_message(f"Data exported to JSON: {filename}")
                 messagebox.showinfo("Success", f"Data exported successfully to:\n{filename}")
             except Exception as e:
@@ -532,9 +796,11 @@ class DarkWebScraperGUI:
         stats_text.config(state=tk.DISABLED)
 
     def clear_log(self):
+        self._flush_log_queue()
         self.log_text.delete(1.0, tk.END)
 
     def save_log(self):
+        self._flush_log_queue()
         log_content = self.log_text.get(1.0, tk.END)
         if not log_content.strip():
             messagebox.showwarning("Warning", "No log content to save!")
@@ -556,6 +822,7 @@ class DarkWebScraperGUI:
         if self.is_scraping:
             if messagebox.askokcancel("Quit", "Crawling is in progress. Do you want to quit?"):
                 self.is_scraping = False
+                self.stop_event.set()
                 self.root.destroy()
         else:
             self.root.destroy()